@@ -0,0 +1,4 @@
+from dotenv import load_dotenv
+
+# Load .env once before test collection so skipif markers can see API keys
+load_dotenv()
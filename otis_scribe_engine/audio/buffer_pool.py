@@ -0,0 +1,53 @@
+from collections import deque
+from typing import Dict, Tuple
+import numpy as np
+
+class NdArrayPool:
+    """Recycles fixed-shape numpy arrays so realtime paths don't allocate per frame"""
+
+    def __init__(self, max_per_shape: int = 64, max_bytes: int = 1 << 20):
+        """
+        Initialize the pool
+
+        Args:
+            max_per_shape (int): Free arrays kept per (shape, dtype); extras are dropped
+            max_bytes (int): Arrays larger than this are never pooled
+        """
+        self.max_per_shape = max_per_shape
+        self.max_bytes = max_bytes
+        self._free: Dict[Tuple[Tuple[int, ...], str], deque] = {}
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.float32) -> np.ndarray:
+        """
+        Get an array of the given shape and dtype (contents are undefined)
+
+        Args:
+            shape (Tuple[int, ...]): Array shape
+            dtype: Array dtype
+
+        Returns:
+            np.ndarray: Pooled or newly allocated array
+        """
+        free = self._free.get((tuple(shape), np.dtype(dtype).str))
+        # deque.pop/append are atomic, so one thread may acquire while another releases
+        if free:
+            try:
+                return free.pop()
+            except IndexError:
+                pass
+        return np.empty(shape, dtype=dtype)
+
+    def release(self, array: np.ndarray) -> None:
+        """
+        Return an array to the pool; the caller must not use it afterwards
+
+        Args:
+            array (np.ndarray): Array previously obtained from acquire()
+        """
+        if array.nbytes > self.max_bytes:
+            return
+        key = (array.shape, array.dtype.str)
+        free = self._free.get(key)
+        if free is None:
+            free = self._free.setdefault(key, deque(maxlen=self.max_per_shape))
+        free.append(array)
@@ -4,18 +4,31 @@ import sounddevice as sd
 import soundfile as sf
 import numpy as np
 from typing import Optional, Tuple
+import queue
+import sys
 import tempfile
+import threading
 import time
+from .buffer_pool import NdArrayPool
 from .devices import AudioDeviceManager
-from .vad import VoiceActivityDetector, VADConfig
+from .vad import VoiceActivityDetector, VADConfig, VAD_FRAME_SIZE
+
+_POOL = NdArrayPool()
 
 class AudioRecorder:
     """Handles audio recording with voice activity detection"""
 
+    INITIAL_CAPACITY_SECONDS = 600
+    LEVEL_WINDOW = 1024
+    FEEDBACK_INTERVAL = 3  # Redraw every 3rd VAD frame (~100ms)
+    LEVEL_BAR_WIDTH = 50
+    _LEVEL_BAR = '=' * LEVEL_BAR_WIDTH
+
     def __init__(self,
                  output_dir: Optional[Path] = None,
                  device_id: Optional[int] = None,
-                 vad_config: Optional[VADConfig] = None):
+                 vad_config: Optional[VADConfig] = None,
+                 show_feedback: bool = True):
         """
         Initialize the recorder
 
@@ -23,6 +36,7 @@ class AudioRecorder:
             output_dir (Optional[Path]): Directory to save recordings (uses temp dir if None)
             device_id (Optional[int]): Specific device ID to use
             vad_config (Optional[VADConfig]): Custom VAD configuration
+            show_feedback (bool): Draw the live VAD/level meter on stdout
         """
         self.device_id = device_id or AudioDeviceManager.get_default_devices()[0]
         valid, message, device_info = AudioDeviceManager.validate_device(self.device_id)
@@ -30,15 +44,26 @@ class AudioRecorder:
             raise ValueError(f"Invalid audio device: {message}")
         self.device_info = device_info
         self.sample_rate = 16000
-        self.block_size = 512
-        self.buffer = []
+        self.block_size = VAD_FRAME_SIZE
+
+        # Preallocated so the realtime callback only copies samples (no per-sample boxing)
+        self._record_buf = np.empty(self.sample_rate * self.INITIAL_CAPACITY_SECONDS, dtype=np.float32)
+        self._record_idx = 0
+        self._vad_chunk = None
+        self._vad_fill = 0
+        # Silero runs on a worker so model jitter can't stall PortAudio's realtime thread
+        self._vad_queue = queue.SimpleQueue()
+        self._vad_thread = None
+        self._vad_error = None
+        self._abs_scratch = np.empty(self.LEVEL_WINDOW, dtype=np.float32)
+        self._feedback_counter = 0
+        self.show_feedback = show_feedback
 
         self.vad = VoiceActivityDetector(vad_config)
         self.output_dir = output_dir
         if self.output_dir:
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        self.recording_data = []
         self.is_recording = False
         self.speech_detected = False
         self.start_time = None
@@ -50,40 +75,94 @@ class AudioRecorder:
         if status:
             print(f"Status: {status}")
 
-        self.recording_data.extend(indata[:, 0])
-        self.buffer.extend(indata[:, 0])
+        samples = indata[:, 0]
+        end = self._record_idx + frames
+        if end > len(self._record_buf):
+            self._record_buf = np.resize(self._record_buf, max(end, 2 * len(self._record_buf)))
+        self._record_buf[self._record_idx:end] = samples
+        self._record_idx = end
 
-        if len(self.buffer) >= self.block_size:
-            audio_chunk = np.array(self.buffer[:self.block_size])
-            frame_duration = self.block_size / self.sample_rate
+        # PortAudio normally delivers exactly one VAD frame per callback
+        if frames == self.block_size and self._vad_fill == 0:
+            chunk = _POOL.acquire((self.block_size,), np.float32)
+            chunk[:] = samples
+            self._vad_queue.put_nowait(chunk)
+        else:
+            self._accumulate_vad_frames(samples)
+
+        if self._stop_requested:
+            self.is_recording = False
+            raise sd.CallbackStop()
 
-            state, speech_prob, valid_speech = self.vad.process_audio(audio_chunk, frame_duration)
+    def _accumulate_vad_frames(self, samples: np.ndarray) -> None:
+        """Carry odd-sized callback blocks over into full VAD frames"""
+        offset = 0
+        while offset < len(samples):
+            if self._vad_chunk is None:
+                self._vad_chunk = _POOL.acquire((self.block_size,), np.float32)
+            count = min(self.block_size - self._vad_fill, len(samples) - offset)
+            self._vad_chunk[self._vad_fill:self._vad_fill + count] = samples[offset:offset + count]
+            self._vad_fill += count
+            offset += count
+
+            if self._vad_fill < self.block_size:
+                break
+            self._vad_queue.put_nowait(self._vad_chunk)
+            self._vad_chunk = None
+            self._vad_fill = 0
+
+    def _vad_worker(self, frames: queue.SimpleQueue) -> None:
+        """Run VAD on queued frames until a None sentinel arrives"""
+        frame_duration = self.block_size / self.sample_rate
+        while True:
+            chunk = frames.get()
+            if chunk is None:
+                return
+
+            try:
+                state, speech_prob, valid_speech = self.vad.process_audio(chunk, frame_duration)
+            except Exception as e:
+                # Handed to record(), which re-raises it once the stream is closed
+                self._vad_error = e
+                self._stop_requested = True
+                return
+            finally:
+                _POOL.release(chunk)
 
             if valid_speech:
                 self.speech_detected = True
 
-            self._show_feedback(speech_prob, valid_speech)
+            # When behind, catch up on the backlog and only redraw for the newest frame
+            if self.show_feedback and frames.empty():
+                self._show_feedback(speech_prob, valid_speech)
 
-            if self._stop_requested or (self.speech_detected and self.vad.should_stop_recording()):
-                self.is_recording = False
-                raise sd.CallbackStop()
+            if self.speech_detected and self.vad.should_stop_recording():
+                self._stop_requested = True
 
-            self.buffer = self.buffer[self.block_size:]
+    @property
+    def recording_data(self) -> np.ndarray:
+        """Samples recorded so far (view into the preallocated buffer)"""
+        return self._record_buf[:self._record_idx]
 
     def _show_feedback(self, speech_prob: float, valid_speech: bool) -> None:
         """Display recording feedback with validation status"""
+        self._feedback_counter += 1
+        if self._feedback_counter % self.FEEDBACK_INTERVAL:
+            return
+
         vad_feedback = self.vad.get_state_feedback(speech_prob)
 
         if not self.speech_detected and speech_prob > self.vad.config.threshold_speech:
             vad_feedback += " (Validating...)"
 
-        current_chunk = np.array(self.recording_data[-1024:]) if self.recording_data else np.array([])
-        if len(current_chunk) > 0:
-            level = np.max(np.abs(current_chunk))
-            level_bar = '=' * int(level * 50)
-            print(f"\r{vad_feedback} |{level_bar:<50}|", end='')
+        window = self._record_buf[max(0, self._record_idx - self.LEVEL_WINDOW):self._record_idx]
+        if window.size > 0:
+            level = np.abs(window, out=self._abs_scratch[:window.size]).max()
+            level_bar = self._LEVEL_BAR[:int(level * self.LEVEL_BAR_WIDTH)]
+            sys.stdout.write(f"\r{vad_feedback} |{level_bar:<{self.LEVEL_BAR_WIDTH}}|")
         else:
-            print(f"\r{vad_feedback}", end='')
+            sys.stdout.write(f"\r{vad_feedback}")
+        sys.stdout.flush()
 
     def record(self) -> Tuple[Path, float]:
         """
@@ -95,13 +174,21 @@ class AudioRecorder:
         print(f"\nInitializing recording device: {self.device_info['name']}")
         print(f"Using sample rate: {self.sample_rate}")
         print("\n🎤 Ready to record. Start speaking...")
-        self.recording_data = []
-        self.buffer = []
+        self._record_idx = 0
+        self._vad_fill = 0
+        self._feedback_counter = 0
         self.is_recording = True
         self.speech_detected = False
         self._stop_requested = False
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.vad.reset()
+        # A fresh queue so frames (or the sentinel) left behind by a failed worker can't leak in
+        self._vad_queue = queue.SimpleQueue()
+        self._vad_error = None
+        self._vad_thread = threading.Thread(
+            target=self._vad_worker, args=(self._vad_queue,), name="vad-worker", daemon=True
+        )
+        self._vad_thread.start()
 
         try:
             with sd.InputStream(
@@ -110,6 +197,7 @@ class AudioRecorder:
                 samplerate=self.sample_rate,
                 callback=self.audio_callback,
                 blocksize=self.block_size,
+                latency='low',
                 dtype=np.float32
             ):
                 while self.is_recording:
@@ -123,6 +211,11 @@ class AudioRecorder:
             raise
         finally:
             self.is_recording = False
+            self._vad_queue.put(None)
+            self._vad_thread.join()
+
+        if self._vad_error is not None:
+            raise self._vad_error
 
         return self._save_recording()
 
@@ -138,7 +231,7 @@ class AudioRecorder:
             while self.is_recording:
                 time.sleep(0.1)
 
-        return self._save_recording() if self.recording_data else (None, 0)
+        return self._save_recording() if self._record_idx else (None, 0)
 
     def _save_recording(self) -> Tuple[Path, float]:
         """
@@ -147,14 +240,13 @@ class AudioRecorder:
         Returns:
             Tuple[Path, float]: Audio file path and duration in seconds
         """
-        if not self.recording_data:
+        if not self._record_idx:
             raise ValueError("No audio data to save")
 
-        audio_data = np.array(self.recording_data)
-        if np.max(np.abs(audio_data)) > 0:
-            audio_data = audio_data / np.max(np.abs(audio_data))
+        # Already float32 in [-1, 1] from sounddevice; transcribers don't need peak normalization
+        audio_data = self._record_buf[:self._record_idx]
 
-        self.duration = time.time() - self.start_time if self.start_time else 0
+        self.duration = time.perf_counter() - self.start_time if self.start_time else 0
 
         if self.output_dir:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -164,7 +256,7 @@ class AudioRecorder:
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
             file_path = Path(temp_file.name)
 
-        sf.write(str(file_path), audio_data, self.sample_rate)
+        sf.write(str(file_path), audio_data, self.sample_rate, subtype='PCM_16')
         print(f"\nRecording saved: {file_path}")
 
         return file_path, self.duration
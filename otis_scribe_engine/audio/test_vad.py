@@ -0,0 +1,32 @@
+import numpy as np
+import soundfile as sf
+from pathlib import Path
+from scipy.signal import resample_poly
+from .vad import VoiceActivityDetector, VADConfig, VAD_FRAME_SIZE
+
+
+def _run_vad(config, audio):
+    vad = VoiceActivityDetector(config)
+    frame_duration = VAD_FRAME_SIZE / config.sample_rate
+    return [
+        vad.process_audio(audio[start:start + VAD_FRAME_SIZE], frame_duration)
+        for start in range(0, len(audio) - VAD_FRAME_SIZE + 1, VAD_FRAME_SIZE)
+    ]
+
+
+def test_silence_gate_keeps_vad_decisions():
+    """Integration test - skipping inference on quiet frames must not change what the VAD decides"""
+
+    test_fixture = Path(__file__).parent.parent.parent / "test_fixtures" / "sample.wav"
+    audio, sample_rate = sf.read(str(test_fixture), dtype='float32')
+    audio = resample_poly(audio, 16000, sample_rate).astype(np.float32)
+    # Surround the speech with silence so the gate engages and the recording would auto-stop
+    audio = np.concatenate([np.zeros(8000, np.float32), audio, np.zeros(3 * 16000, np.float32)])
+
+    config = VADConfig()
+    gated = _run_vad(config, audio)
+    ungated = _run_vad(VADConfig(silence_gate=0.0), audio)
+
+    assert any(prob == 0.0 for _, prob, _ in gated), "Silence gate never skipped inference"
+    assert [(state, prob > config.threshold_speech, valid) for state, prob, valid in gated] == \
+        [(state, prob > config.threshold_speech, valid) for state, prob, valid in ungated]
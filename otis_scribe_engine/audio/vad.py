@@ -1,9 +1,39 @@
-import torch
 from enum import Enum
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
 from typing import Optional
 import numpy as np
+import onnxruntime as ort
 from dataclasses import dataclass
 
+# Silero VAD expects exactly 512 samples per call at 16kHz
+VAD_FRAME_SIZE = 512
+# Silero v5+ prepends the previous frame's last 64 samples to every input
+VAD_CONTEXT_SIZE = 64
+VAD_STATE_SHAPE = (2, 1, 128)
+
+def _silero_model_path() -> Path:
+    """Locate the ONNX model shipped with silero-vad without importing it (its package imports torch)"""
+    spec = find_spec("silero_vad")
+    if spec is None or not spec.submodule_search_locations:
+        raise ImportError("silero-vad is required for voice activity detection")
+    return Path(spec.submodule_search_locations[0]) / "data" / "silero_vad.onnx"
+
+@lru_cache(maxsize=1)
+def _load_silero_session() -> ort.InferenceSession:
+    """Build the Silero session once per process; detectors share it"""
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    # A 512-sample frame is too small for thread fan-out to pay for its wake-up cost
+    options.intra_op_num_threads = 1
+    options.inter_op_num_threads = 1
+    return ort.InferenceSession(
+        str(_silero_model_path()),
+        sess_options=options,
+        providers=['CPUExecutionProvider']
+    )
+
 class VoiceState(Enum):
     """Enum for different voice activity states"""
     SPEECH = "SPEECH"
@@ -20,6 +50,8 @@ class VADConfig:
     silence_duration_long: float = 1.5
     silence_duration_max: float = 2.5
     min_speech_duration: float = 0.5
+    silence_gate: float = 0.003  # Peak amplitude below which a frame counts as quiet (0 disables gating)
+    silence_gate_frames: int = 8  # Quiet frames still run through the model before inference is skipped
 
 class VoiceActivityDetector:
     """Handles voice activity detection using Silero VAD"""
@@ -33,18 +65,28 @@ class VoiceActivityDetector:
         """
         self.config = config or VADConfig()
 
-        model, utils = torch.hub.load(
-            repo_or_dir='snakers4/silero-vad',
-            model='silero_vad',
-            force_reload=False
-        )
-        self.model = model
-        self.model.eval()
+        # Session.run is thread-safe; all per-stream state lives in this detector's bound arrays
+        self.session = _load_silero_session()
 
-        self.silence_duration = 0.0
-        self.speech_duration = 0.0
-        self.current_state = VoiceState.SILENCE
-        self.valid_speech_detected = False
+        # Model inputs/outputs live in these arrays; the binding holds raw pointers to them,
+        # so each frame only rewrites them in place
+        self._input = np.zeros((1, VAD_CONTEXT_SIZE + VAD_FRAME_SIZE), dtype=np.float32)
+        self._state = np.zeros(VAD_STATE_SHAPE, dtype=np.float32)
+        self._state_out = np.zeros(VAD_STATE_SHAPE, dtype=np.float32)
+        self._sample_rate = np.array(self.config.sample_rate, dtype=np.int64)
+        self._speech_prob = np.zeros((1, 1), dtype=np.float32)
+        self._abs_buf = np.empty(VAD_FRAME_SIZE, dtype=np.float32)
+
+        self._binding = self.session.io_binding()
+        for name, array in (('input', self._input), ('state', self._state), ('sr', self._sample_rate)):
+            self._binding.bind_input(name, 'cpu', 0, array.dtype, list(array.shape), array.ctypes.data)
+        for name, array in (('output', self._speech_prob), ('stateN', self._state_out)):
+            self._binding.bind_output(name, 'cpu', 0, array.dtype, list(array.shape), array.ctypes.data)
+
+        # Keep first-run allocations off the audio callback
+        self.session.run_with_iobinding(self._binding)
+
+        self.reset()
 
     def process_audio(self, audio_chunk: np.ndarray,
                      frame_duration: float) -> tuple[VoiceState, float]:
@@ -58,19 +100,32 @@ class VoiceActivityDetector:
         Returns:
             tuple[VoiceState, float]: Current voice state and speech probability
         """
-        required_samples = 512
-        if len(audio_chunk) != required_samples:
-            if len(audio_chunk) < required_samples:
-                audio_chunk = np.pad(audio_chunk, (0, required_samples - len(audio_chunk)))
+        if len(audio_chunk) != VAD_FRAME_SIZE:
+            if len(audio_chunk) < VAD_FRAME_SIZE:
+                audio_chunk = np.pad(audio_chunk, (0, VAD_FRAME_SIZE - len(audio_chunk)))
             else:
-                audio_chunk = audio_chunk[:required_samples]
+                audio_chunk = audio_chunk[:VAD_FRAME_SIZE]
 
-        audio_tensor = torch.from_numpy(audio_chunk).float()
-        if torch.max(torch.abs(audio_tensor)) > 0:
-            audio_tensor = audio_tensor / torch.max(torch.abs(audio_tensor))
+        if np.abs(audio_chunk, out=self._abs_buf).max() < self.config.silence_gate:
+            self._quiet_frames += 1
+        else:
+            self._quiet_frames = 0
+
+        # Only skip once the model has seen a run of quiet frames: by then its recurrent state has
+        # settled on silence, so resuming from the frozen state doesn't change later decisions
+        if self._quiet_frames > self.config.silence_gate_frames:
+            speech_prob = 0.0
+            # Model is skipped, but the next frame's context must still be this frame's tail
+            self._input[0, :VAD_CONTEXT_SIZE] = audio_chunk[-VAD_CONTEXT_SIZE:]
+        else:
+            # Silero is trained on raw [-1, 1] PCM; per-chunk peak normalization only amplified noise
+            self._input[0, VAD_CONTEXT_SIZE:] = audio_chunk
 
-        with torch.no_grad():
-            speech_prob = self.model(audio_tensor, self.config.sample_rate).item()
+            self.session.run_with_iobinding(self._binding)
+            # Can't bind stateN to the state input buffer: the model reads it while writing
+            np.copyto(self._state, self._state_out)
+            self._input[0, :VAD_CONTEXT_SIZE] = self._input[0, -VAD_CONTEXT_SIZE:]
+            speech_prob = float(self._speech_prob[0, 0])
 
         if speech_prob > self.config.threshold_speech:
             self.silence_duration = 0.0
@@ -127,6 +182,10 @@ class VoiceActivityDetector:
 
     def reset(self):
         """Reset the VAD state"""
+        # In place: the IO binding points at these buffers
+        self._state.fill(0.0)
+        self._input.fill(0.0)
+        self._quiet_frames = 0
         self.silence_duration = 0.0
         self.speech_duration = 0.0
         self.current_state = VoiceState.SILENCE
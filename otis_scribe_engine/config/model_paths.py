@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
@@ -17,7 +18,7 @@ class ModelPaths:
         for field_name in self.__dataclass_fields__:
             field_value = getattr(self, field_name)
             if isinstance(field_value, Path):
-                setattr(self, field_name, field_value.resolve())
+                setattr(self, field_name, field_value.expanduser().absolute())
 
     def create_directories(self):
         """Create all model directories if they don't exist"""
@@ -37,6 +38,10 @@ class ModelPaths:
 
     def model_exists(self, model_path: Path) -> bool:
         """Check if a model exists locally"""
-        return model_path.exists() and any(model_path.iterdir())
+        try:
+            with os.scandir(model_path) as entries:
+                return next(entries, None) is not None
+        except (FileNotFoundError, NotADirectoryError):
+            return False
 
 MODEL_PATHS = ModelPaths()
@@ -1,14 +1,33 @@
+import importlib
+from typing import TYPE_CHECKING
 from .base import Transcriber
-from .gemini import GeminiTranscriber
-from .whisper import WhisperTranscriber
-from .mistral_api import MistralTranscriber
+
+if TYPE_CHECKING:
+    from .gemini import GeminiTranscriber
+    from .whisper import WhisperTranscriber
+    from .mistral_api import MistralTranscriber
+
+# Each engine drags in its SDK (torch, google-genai, mistralai), so only import the one in use
+_LAZY_EXPORTS = {
+    'GeminiTranscriber': '.gemini',
+    'WhisperTranscriber': '.whisper',
+    'MistralTranscriber': '.mistral_api',
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_transcriber(engine: str, **kwargs) -> Transcriber:
     if engine == "gemini":
+        from .gemini import GeminiTranscriber
         return GeminiTranscriber(**kwargs)
     elif engine == "whisper":
+        from .whisper import WhisperTranscriber
         return WhisperTranscriber(**kwargs)
     elif engine == "mistral":
+        from .mistral_api import MistralTranscriber
         return MistralTranscriber(**kwargs)
     else:
         raise ValueError(f"Unknown transcription engine: {engine}")
@@ -1,4 +1,12 @@
+import asyncio
+import functools
 from abc import ABC, abstractmethod
+from dotenv import load_dotenv
+
+@functools.cache
+def _load_env_once():
+    """Read .env into os.environ on first use rather than re-parsing it for every transcriber."""
+    load_dotenv()
 
 class Transcriber(ABC):
     """Abstract base class for transcription engines."""
@@ -18,3 +26,16 @@ class Transcriber(ABC):
                 }
         """
         pass
+
+    async def transcribe_async(self, audio_file_path):
+        """Transcribe without blocking the event loop.
+
+        Runs transcribe() in a worker thread; engines with a native async client override this.
+
+        Args:
+            audio_file_path: Path to the audio file
+
+        Returns:
+            dict: Same as transcribe()
+        """
+        return await asyncio.to_thread(self.transcribe, audio_file_path)
@@ -0,0 +1,43 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+class ResultCache:
+    """On-disk transcription results keyed by audio content + engine settings."""
+
+    def __init__(self, cache_dir):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached results (created on first write)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+
+    def audio_digest(self, audio_file_path):
+        """Hash the audio bytes; combine with key() to derive cache keys."""
+        with open(audio_file_path, "rb") as audio_file:
+            return hashlib.file_digest(audio_file, lambda: hashlib.blake2b(digest_size=20)).hexdigest()
+
+    def key(self, audio_digest, *settings):
+        """Combine an audio digest with anything that changes the transcription."""
+        digest = hashlib.blake2b(audio_digest.encode(), digest_size=20)
+        for setting in settings:
+            digest.update(b"\0" + str(setting).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        try:
+            with open(self.cache_dir / f"{key}.json", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def set(self, key, result):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_dir / f"{key}.json")
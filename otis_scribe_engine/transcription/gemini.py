@@ -2,8 +2,7 @@ import os
 import time
 from google import genai
 from google.genai import types
-from dotenv import load_dotenv
-from .base import Transcriber
+from .base import Transcriber, _load_env_once
 
 class GeminiTranscriber(Transcriber):
     """Gemini API-based transcription."""
@@ -15,7 +14,7 @@ class GeminiTranscriber(Transcriber):
             api_key: Gemini API key (if None, loads from environment)
             debug: Enable debug mode (token counting, detailed metrics)
         """
-        load_dotenv()
+        _load_env_once()
 
         if api_key is None:
             api_key = os.environ.get("GOOGLE_API_KEY")
@@ -40,7 +39,7 @@ class GeminiTranscriber(Transcriber):
                 'tokens': dict (if debug=True),
             }
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         audio_file = self.client.files.upload(file=audio_file_path)
 
@@ -70,7 +69,7 @@ class GeminiTranscriber(Transcriber):
             )
         )
 
-        transcription_time = time.time() - start_time
+        transcription_time = time.perf_counter() - start_time
 
         if self.debug and tokens_data:
             output_tokens = len(response.text.split()) * 1.3
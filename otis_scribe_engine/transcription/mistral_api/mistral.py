@@ -1,23 +1,162 @@
+import asyncio
+import functools
 import os
+import random
+import shutil
+import subprocess
+import threading
 import time
 from pathlib import Path
+from typing import Optional
+import httpx
+import soundfile as sf
 from mistralai import Mistral
-from mistralai.models import File
-from dotenv import load_dotenv
-from ..base import Transcriber
+from mistralai.models import File, SDKError
+from ..base import Transcriber, _load_env_once
+from ..cache import ResultCache
+
+RATE_LIMIT_RETRIES = 5
+
+@functools.lru_cache(maxsize=4)
+def _get_mistral_client(api_key: str) -> Mistral:
+    """One client per API key so its pooled httpx connections stay warm across transcribers."""
+    return Mistral(api_key=api_key)
+
+# httpx.AsyncClient pools connections on the event loop that first used it, so each loop gets
+# its own client per API key; entries for loops that have since closed are dropped
+_async_clients = {}
+_async_clients_lock = threading.Lock()
+
+def _get_async_mistral_client(api_key: str) -> Mistral:
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        for key in [key for key in _async_clients if key[1].is_closed()]:
+            # Its connections went down with the loop (e.g. each asyncio.run()); nothing can aclose them now
+            del _async_clients[key]
+        client = _async_clients.get((api_key, loop))
+        if client is None:
+            # Reuse the sync client's pool instead of letting Mistral open a second, unused one
+            client = _async_clients[(api_key, loop)] = Mistral(
+                api_key=api_key,
+                client=_get_mistral_client(api_key).sdk_configuration.client,
+                async_client=httpx.AsyncClient(follow_redirects=True),
+            )
+        return client
+
+class _TokenBucket:
+    """Spaces out requests to a steady rate, allowing bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity=1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self):
+        """Take a token (possibly going into debt) and return how long to wait before using it."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def set_rate(self, rate):
+        with self._lock:
+            # Tokens earned so far accrue at the old rate
+            self._refill()
+            self.rate = rate
+
+    def acquire(self):
+        time.sleep(self._reserve())
+
+    async def acquire_async(self):
+        await asyncio.sleep(self._reserve())
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+def _get_rate_limiter(api_key: str, requests_per_second: float) -> _TokenBucket:
+    """Rate limits apply per API key, so every throttled transcriber using the key shares one bucket.
+
+    A transcriber asking for a different rate retunes that bucket for all of them.
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(api_key)
+        if limiter is None:
+            limiter = _rate_limiters[api_key] = _TokenBucket(requests_per_second)
+        elif limiter.rate != requests_per_second:
+            limiter.set_rate(requests_per_second)
+        return limiter
+
+def _is_rate_limited(error: SDKError) -> bool:
+    return getattr(error, 'status_code', None) == 429
+
+def _backoff_delay(attempt: int) -> float:
+    # Jitter keeps concurrent callers from retrying in lockstep
+    return 2 ** attempt + random.random()
+
+def _rewind(request_kwargs):
+    content = request_kwargs['file'].content
+    if hasattr(content, 'seek'):
+        content.seek(0)
+
+_PCM_CONTAINERS = {"WAV", "WAVEX", "RF64", "W64", "AIFF"}
+_PCM_SUBTYPES = {"PCM_S8", "PCM_U8", "PCM_16", "PCM_24", "PCM_32", "FLOAT", "DOUBLE"}
+
+def _to_16k_mono_pcm16(audio_file_path) -> Optional[bytes]:
+    """Re-encode uncompressed audio as 16 kHz mono PCM16 WAV when that shrinks the upload.
+
+    Returns None (send the original file) for compressed input such as mp3, m4a, ogg/opus or
+    flac, which is already smaller than 256 kbps PCM16, when conversion wouldn't save bytes,
+    or when ffmpeg is missing.
+    """
+    try:
+        info = sf.info(str(audio_file_path))
+    except RuntimeError:
+        return None  # Not a libsndfile format (e.g. m4a), so compressed
+    if info.format not in _PCM_CONTAINERS or info.subtype not in _PCM_SUBTYPES:
+        return None
+    if (info.subtype, info.samplerate, info.channels) == ("PCM_16", 16000, 1):
+        return None
+
+    if shutil.which("ffmpeg") is None:
+        return None
+
+    result = subprocess.run(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-i", str(audio_file_path),
+         "-ac", "1", "-ar", "16000", "-acodec", "pcm_s16le", "-f", "wav", "pipe:1"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    if result.returncode != 0:
+        return None
+    # e.g. 8 kHz input gets upsampled; only send the conversion when it is actually smaller
+    return result.stdout if len(result.stdout) < os.path.getsize(audio_file_path) else None
 
 class MistralTranscriber(Transcriber):
     """Mistral API-based transcription using Voxtral models."""
 
-    def __init__(self, model="voxtral-mini-latest", api_key=None, debug=False):
+    def __init__(self, model="voxtral-mini-latest", api_key=None, debug=False, language=None,
+                 max_concurrent=4, requests_per_second=None, cache_dir=None):
         """Initialize Mistral transcriber.
 
         Args:
             model: Mistral model identifier (e.g., "voxtral-mini-latest")
             api_key: Mistral API key (if None, loads from environment)
             debug: Enable debug mode (detailed metrics)
+            language: Language code (e.g., "fr", "en") or None for auto-detection
+            max_concurrent: Maximum in-flight transcribe_async() requests
+            requests_per_second: Throttle requests for this API key (None = no throttling);
+                shared with, and overriding the rate of, other throttled transcribers on the
+                same key. 429 responses are always retried with exponential backoff
+            cache_dir: Directory for cached results of previously seen audio (None = no caching)
         """
-        load_dotenv()
+        _load_env_once()
 
         if api_key is None:
             api_key = os.environ.get("MISTRAL_API_KEY")
@@ -25,9 +164,16 @@ class MistralTranscriber(Transcriber):
         if not api_key:
             raise ValueError("MISTRAL_API_KEY not found in environment")
 
-        self.client = Mistral(api_key=api_key)
+        self._api_key = api_key
+        self.client = _get_mistral_client(api_key)
         self.model = model
         self.debug = debug
+        self.language = language
+        self.max_concurrent = max_concurrent
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._rate_limiter = _get_rate_limiter(api_key, requests_per_second) if requests_per_second else None
+        self._cache = ResultCache(cache_dir) if cache_dir else None
 
     def transcribe(self, audio_file_path):
         """Transcribe audio using Mistral API.
@@ -43,39 +189,153 @@ class MistralTranscriber(Transcriber):
                 'tokens': dict (if debug=True)
             }
         """
-        start_time = time.time()
+        cache_key, cached = self._cache_lookup(audio_file_path)
+        if cached is not None:
+            return self._with_tokens(cached)
+
+        start_time = time.perf_counter()
 
         if self.debug:
             print(f"Transcribing with Mistral model: {self.model}")
             print(f"Audio file: {audio_file_path}")
 
-        with open(audio_file_path, "rb") as audio_file:
-            file_obj = File(
-                file_name=Path(audio_file_path).name,
-                content=audio_file
-            )
-            response = self.client.audio.transcriptions.complete(
-                model=self.model,
-                file=file_obj
-            )
+        wav_bytes = _to_16k_mono_pcm16(audio_file_path)
+        if wav_bytes is not None:
+            response = self._complete(self._request_kwargs(audio_file_path, wav_bytes, converted=True))
+        else:
+            with open(audio_file_path, "rb") as audio_file:
+                response = self._complete(self._request_kwargs(audio_file_path, audio_file, converted=False))
+
+        result = self._build_result(response, time.perf_counter() - start_time)
+        if cache_key:
+            self._cache.set(cache_key, result)
+        return self._with_tokens(result)
+
+    async def transcribe_async(self, audio_file_path):
+        """Transcribe audio using Mistral's async API.
+
+        At most max_concurrent requests from this transcriber are in flight at once,
+        so callers can asyncio.gather() many files without tripping rate limits.
+
+        Args:
+            audio_file_path: Path to audio file
+
+        Returns:
+            dict: Same as transcribe()
+        """
+        cache_key, cached = await asyncio.to_thread(self._cache_lookup, audio_file_path)
+        if cached is not None:
+            return self._with_tokens(cached)
 
-        transcription_time = time.time() - start_time
+        async with self._get_semaphore():
+            start_time = time.perf_counter()
 
+            if self.debug:
+                print(f"Transcribing with Mistral model: {self.model}")
+                print(f"Audio file: {audio_file_path}")
+
+            wav_bytes = await asyncio.to_thread(_to_16k_mono_pcm16, audio_file_path)
+            if wav_bytes is not None:
+                request_kwargs = self._request_kwargs(audio_file_path, wav_bytes, converted=True)
+            else:
+                # httpx would read a file object with blocking calls on the event loop
+                audio_bytes = await asyncio.to_thread(Path(audio_file_path).read_bytes)
+                request_kwargs = self._request_kwargs(audio_file_path, audio_bytes, converted=False)
+            response = await self._complete_async(request_kwargs)
+
+            result = self._build_result(response, time.perf_counter() - start_time)
+        if cache_key:
+            await asyncio.to_thread(self._cache.set, cache_key, result)
+        return self._with_tokens(result)
+
+    def _get_semaphore(self):
+        # asyncio primitives bind to the loop that first awaits them; each asyncio.run() gets its own
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _cache_lookup(self, audio_file_path):
+        """Return (cache_key, cached_result); the key is None when caching is off."""
+        if not self._cache:
+            return None, None
+        start_time = time.perf_counter()
+        cache_key = self._cache.key(self._cache.audio_digest(audio_file_path), "mistral", self.model, self.language)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            # Report this call's cost, not the original request's
+            cached['transcription_time'] = time.perf_counter() - start_time
+            cached['model'] = self.model
+            if self.debug:
+                print(f"Using cached transcription for: {audio_file_path}")
+        return cache_key, cached
+
+    def _complete(self, request_kwargs):
+        for attempt in range(RATE_LIMIT_RETRIES):
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
+            try:
+                return self.client.audio.transcriptions.complete(**request_kwargs)
+            except SDKError as e:
+                if not _is_rate_limited(e) or attempt == RATE_LIMIT_RETRIES - 1:
+                    raise
+                delay = _backoff_delay(attempt)
+                if self.debug:
+                    print(f"⚠️ Rate limited by Mistral, retrying in {delay:.1f}s")
+                time.sleep(delay)
+                _rewind(request_kwargs)
+
+    async def _complete_async(self, request_kwargs):
+        client = _get_async_mistral_client(self._api_key)
+        for attempt in range(RATE_LIMIT_RETRIES):
+            if self._rate_limiter:
+                await self._rate_limiter.acquire_async()
+            try:
+                return await client.audio.transcriptions.complete_async(**request_kwargs)
+            except SDKError as e:
+                if not _is_rate_limited(e) or attempt == RATE_LIMIT_RETRIES - 1:
+                    raise
+                delay = _backoff_delay(attempt)
+                if self.debug:
+                    print(f"⚠️ Rate limited by Mistral, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                _rewind(request_kwargs)
+
+    def _request_kwargs(self, audio_file_path, content, converted):
+        if converted:
+            if self.debug:
+                print(f"Converted to 16 kHz mono PCM16 ({len(content)} bytes)")
+            file_name = Path(audio_file_path).with_suffix(".wav").name
+        else:
+            file_name = Path(audio_file_path).name
+
+        request_kwargs = {
+            'model': self.model,
+            'file': File(file_name=file_name, content=content),
+        }
+        # A known language lets Voxtral skip its detection pass
+        if self.language:
+            request_kwargs['language'] = self.language
+        return request_kwargs
+
+    def _build_result(self, response, transcription_time):
         if self.debug:
             print(f"Transcription completed in {transcription_time:.2f}s")
             if hasattr(response, 'language'):
                 print(f"Detected language: {response.language}")
 
-        result = {
+        return {
             'text': response.text.strip(),
             'transcription_time': transcription_time,
             'model': self.model
         }
 
+    def _with_tokens(self, result):
+        # Added per call rather than cached, so it follows this transcriber's debug setting
         if self.debug:
-            output_tokens = len(response.text.split()) * 1.3
+            output_tokens = len(result['text'].split()) * 1.3
             result['tokens'] = {
                 'total_tokens': int(output_tokens)
             }
-
         return result
@@ -1,12 +1,8 @@
 import pytest
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 from .mistral import MistralTranscriber
 
-# Load .env before test discovery
-load_dotenv()
-
 
 @pytest.mark.skipif(
     not os.getenv("MISTRAL_API_KEY"),
@@ -11,18 +11,55 @@ transformers-based implementation even with MPS acceleration.
 See PERFORMANCE_COMPARISON.md for benchmarks.
 """
 
+import threading
+import types
+import weakref
+import numpy as np
 import whisper
 import time
 import torch
-from typing import Optional
+from typing import Final, Mapping, Optional
 from .base import Transcriber
+from .cache import ResultCache
+
+
+class _SharedModel:
+    """A loaded model and the state that must be shared along with it."""
+
+    def __init__(self, model: whisper.Whisper):
+        self.model = model
+        # Decoding installs kv-cache hooks on the model's modules, so its runs must not overlap
+        self.lock = threading.Lock()
+        self.warmed = False
+
+
+# Weak values: a model stays shared while any transcriber holds it and is freed with the last one
+_models: "weakref.WeakValueDictionary[tuple, _SharedModel]" = weakref.WeakValueDictionary()
+_models_lock = threading.Lock()
+
+
+def _load_whisper(model_name: str, device: str) -> _SharedModel:
+    """Load a Whisper model, reusing the one already held by a transcriber with the same model/device."""
+    key = (model_name, device)
+    with _models_lock:
+        shared = _models.get(key)
+        if shared is None:
+            shared = _SharedModel(whisper.load_model(model_name, device=device))
+            _models[key] = shared
+        return shared
+
+
+# whisper.transcribe() defaults, applied to batched windows the same way
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOGPROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
 
 
 class WhisperTranscriber(Transcriber):
     """Local Whisper-based transcription using openai-whisper."""
 
     # Model name mapping: HuggingFace names -> openai-whisper names
-    MODEL_NAME_MAP = {
+    MODEL_NAME_MAP: Final[Mapping[str, str]] = types.MappingProxyType({
         "openai/whisper-tiny": "tiny",
         "openai/whisper-base": "base",
         "openai/whisper-small": "small",
@@ -38,9 +75,10 @@ class WhisperTranscriber(Transcriber):
         "medium": "medium",
         "large": "large",
         "turbo": "turbo",
-    }
+    })
 
-    def __init__(self, model_id="openai/whisper-tiny", device="auto", debug=False, language=None):
+    def __init__(self, model_id="openai/whisper-tiny", device="auto", debug=False, language=None,
+                 cache_dir=None, warmup=True):
         """Initialize Whisper transcriber.
 
         Args:
@@ -48,9 +86,13 @@ class WhisperTranscriber(Transcriber):
             device: Device to use ("auto", "cpu", "cuda") - Note: MPS not supported
             debug: Enable debug mode (detailed metrics)
             language: Language code (e.g., "fr", "en") or None for auto-detection
+            cache_dir: Directory for cached results of previously seen audio (None = no caching)
+            warmup: On CUDA, decode a second of silence at load time so the first
+                transcribe() doesn't pay for kernel loading and cuBLAS/cuDNN setup
         """
         self.debug = debug
         self.language = language
+        self._cache = ResultCache(cache_dir) if cache_dir else None
         self.model_id_original = model_id
 
         # Convert model name if needed
@@ -75,19 +117,62 @@ class WhisperTranscriber(Transcriber):
             print(f"Loading Whisper model: {self.model_name}")
             print(f"Device: {self.device}")
 
-        # Load model
-        start_time = time.time()
-        self.model = whisper.load_model(self.model_name, device=self.device)
-        load_time = time.time() - start_time
+        # Load model (shared with live transcribers using the same model/device)
+        start_time = time.perf_counter()
+        self._shared = _load_whisper(self.model_name, self.device)
+        self.model = self._shared.model
+        load_time = time.perf_counter() - start_time
 
         if self.debug:
             print(f"Model loaded in {load_time:.2f}s")
 
+        if warmup and self.device == "cuda":
+            self._warm_up()
+
+    def _warm_up(self):
+        with self._shared.lock, torch.inference_mode():
+            if self._shared.warmed:
+                return
+            start_time = time.perf_counter()
+            # One short decode runs every kernel; transcribe() could loop through temperature fallbacks
+            silence = whisper.pad_or_trim(np.zeros(whisper.audio.SAMPLE_RATE, dtype=np.float32))
+            mel = whisper.log_mel_spectrogram(silence, self.model.dims.n_mels).to(self.model.device)
+            options = whisper.DecodingOptions(
+                language=self.language or "en",
+                sample_len=8,
+                fp16=self.device == "cuda",
+            )
+            whisper.decode(self.model, mel, options)
+            self._shared.warmed = True
+
+        if self.debug:
+            print(f"Model warmed up in {time.perf_counter() - start_time:.2f}s")
+
+    @classmethod
+    def clear_cache(cls):
+        """Stop sharing loaded models; the next transcriber loads fresh weights."""
+        with _models_lock:
+            _models.clear()
+
+    def _cache_key(self, audio_digest, decode_mode):
+        # transcribe() and batched decoding produce different text for the same audio;
+        # the device decides fp16 as well
+        return self._cache.key(audio_digest, "whisper", decode_mode, self.model_name, self.language, self.device)
+
+    def _cached_result(self, cache_key, start_time):
+        """Look up a cached result, stamped with this call's timing and model alias."""
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            cached['transcription_time'] = time.perf_counter() - start_time
+            cached['model'] = self.model_id_original
+        return cached
+
     def transcribe(self, audio_file_path):
         """Transcribe audio using openai-whisper.
 
         Args:
-            audio_file_path: Path to audio file
+            audio_file_path: Path to audio file, or 16 kHz mono samples as a numpy array
+                (e.g. AudioRecorder.recording_data) to skip decoding the file with ffmpeg
 
         Returns:
             dict: {
@@ -96,28 +181,147 @@ class WhisperTranscriber(Transcriber):
                 'model': str
             }
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        is_array = isinstance(audio_file_path, np.ndarray)
+        cache_key = None
+        if self._cache and not is_array:
+            cache_key = self._cache_key(self._cache.audio_digest(audio_file_path), "transcribe")
+            cached = self._cached_result(cache_key, start_time)
+            if cached is not None:
+                if self.debug:
+                    print(f"Using cached transcription for: {audio_file_path}")
+                return cached
 
-        if self.debug:
-            print(f"Transcribing audio file: {audio_file_path}")
+        if is_array:
+            audio = np.asarray(audio_file_path, dtype=np.float32)
+            if self.debug:
+                print(f"Transcribing {len(audio) / whisper.audio.SAMPLE_RATE:.1f}s of audio samples")
+        else:
+            audio = str(audio_file_path)
+            if self.debug:
+                print(f"Transcribing audio file: {audio_file_path}")
 
-        # Transcribe with language parameter if specified
-        transcribe_kwargs = {}
+        # Explicit FP32 on CPU: whisper would otherwise warn and fall back on every call
+        transcribe_kwargs = {'fp16': self.device == "cuda"}
         if self.language:
             transcribe_kwargs['language'] = self.language
             if self.debug:
                 print(f"Using language: {self.language}")
 
-        result = self.model.transcribe(str(audio_file_path), **transcribe_kwargs)
-        transcription_time = time.time() - start_time
+        with self._shared.lock, torch.inference_mode():
+            result = self.model.transcribe(audio, **transcribe_kwargs)
+        transcription_time = time.perf_counter() - start_time
 
         if self.debug:
             print(f"Transcription completed in {transcription_time:.2f}s")
             print(f"Detected language: {result.get('language', 'N/A')}")
             print(f"Segments: {len(result.get('segments', []))}")
 
-        return {
+        result = {
             'text': result['text'].strip(),
             'transcription_time': transcription_time,
             'model': self.model_id_original
         }
+        if cache_key:
+            self._cache.set(cache_key, result)
+        return result
+
+    def transcribe_batch(self, audio_file_paths, batch_size=8):
+        """Transcribe several audio files, decoding clips of up to 30s together.
+
+        Short clips share one encoder/decoder pass per batch instead of one per file.
+        Longer files fall back to transcribe(), which slides a 30s window over them.
+
+        Args:
+            audio_file_paths: Paths to audio files
+            batch_size: Maximum number of clips decoded together
+
+        Returns:
+            list[dict]: One transcribe()-style result per path, in input order.
+                For batched clips 'transcription_time' is the batch time split evenly;
+                silent clips come back empty and clips that fail whisper's repetition or
+                log-probability checks are redone with transcribe().
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        results = [None] * len(audio_file_paths)
+        cache_keys = [None] * len(audio_file_paths)
+        # Decoded as soon as it fills, so at most batch_size clips are held in memory
+        pending = []
+        for index, audio_file_path in enumerate(audio_file_paths):
+            if self._cache:
+                lookup_start = time.perf_counter()
+                audio_digest = self._cache.audio_digest(audio_file_path)
+                # With batch_size 1 every file takes the transcribe() path
+                cache_keys[index] = self._cache_key(audio_digest, "batch" if batch_size > 1 else "transcribe")
+                results[index] = self._cached_result(cache_keys[index], lookup_start)
+                if results[index] is not None:
+                    continue
+
+            audio = whisper.load_audio(str(audio_file_path))
+            if batch_size > 1 and len(audio) <= whisper.audio.N_SAMPLES:
+                pending.append((index, audio))
+                if len(pending) == batch_size:
+                    self._decode_batch(pending, results, cache_keys)
+                    pending = []
+            else:
+                if self._cache and batch_size > 1:
+                    # Long files are decoded like transcribe(), so they share its cache entries
+                    cache_keys[index] = self._cache_key(audio_digest, "transcribe")
+                    results[index] = self._cached_result(cache_keys[index], lookup_start)
+                    if results[index] is not None:
+                        continue
+                # Hand over the decoded samples so the file isn't run through ffmpeg twice
+                results[index] = self.transcribe(audio)
+                if cache_keys[index]:
+                    self._cache.set(cache_keys[index], results[index])
+
+        if pending:
+            self._decode_batch(pending, results, cache_keys)
+
+        return results
+
+    def _decode_batch(self, batch, results, cache_keys):
+        """Decode (index, audio) clips together, filling results and the cache in place."""
+        # Greedy, timestamp-free decoding of a single 30s window, as transcribe() does per window
+        options = whisper.DecodingOptions(
+            language=self.language,
+            without_timestamps=True,
+            fp16=self.device == "cuda",
+        )
+        start_time = time.perf_counter()
+        mels = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), self.model.dims.n_mels)
+            for _, audio in batch
+        ]).to(self.model.device)
+        with self._shared.lock, torch.inference_mode():
+            decoded = whisper.decode(self.model, mels, options)
+        per_clip_time = (time.perf_counter() - start_time) / len(batch)
+
+        if self.debug:
+            print(f"Decoded batch of {len(batch)} clips in {per_clip_time * len(batch):.2f}s")
+
+        for (index, audio), result in zip(batch, decoded):
+            if result.no_speech_prob > NO_SPEECH_THRESHOLD and not result.avg_logprob > LOGPROB_THRESHOLD:
+                # Silence: transcribe() skips this window rather than keep a hallucination
+                results[index] = {
+                    'text': '',
+                    'transcription_time': per_clip_time,
+                    'model': self.model_id_original
+                }
+            elif (result.compression_ratio > COMPRESSION_RATIO_THRESHOLD
+                    or result.avg_logprob < LOGPROB_THRESHOLD):
+                # Repetitive or low-confidence greedy output; transcribe() retries at higher temperatures
+                if self.debug:
+                    print(f"Batched clip {index} failed decoding thresholds, retrying with fallback")
+                results[index] = self.transcribe(audio)
+                results[index]['transcription_time'] += per_clip_time
+            else:
+                results[index] = {
+                    'text': result.text.strip(),
+                    'transcription_time': per_clip_time,
+                    'model': self.model_id_original
+                }
+            if cache_keys[index]:
+                self._cache.set(cache_keys[index], results[index])
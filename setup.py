@@ -15,11 +15,13 @@ setup(
         "python-dotenv>=1.0.0",
         "torch>=2.0.0",
         "torchaudio>=2.0.0",
+        "onnxruntime>=1.16.0",
+        "silero-vad>=5.1",
     ],
     extras_require={
         "whisper": [
             "torch>=2.0.0",
-            "openai-whisper>=20231117",  # Official OpenAI Whisper package
+            "openai-whisper>=20240927",  # Official OpenAI Whisper package (SDPA attention)
         ],
         "gemini": [
             "google-genai>=1.0.0",
@@ -32,7 +34,7 @@ setup(
         ],
         "all": [
             "torch>=2.0.0",
-            "openai-whisper>=20231117",
+            "openai-whisper>=20240927",
             "google-genai>=1.0.0",
             "mistralai>=1.0.0",
         ],